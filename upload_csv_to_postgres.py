@@ -10,14 +10,30 @@ Database Configuration:
 
 import os
 import sys
+import multiprocessing
+import threading
+import time
+from functools import lru_cache, partial
+from itertools import chain
+import numpy as np
 import pandas as pd
+import argparse
 import psycopg2
+import psycopg2.errors
 from psycopg2 import sql
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, encodings
+from psycopg2.extras import execute_values
 import getpass
 from pathlib import Path
 import re
-from typing import Dict, List
+from io import BytesIO, StringIO
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; pandas parses the CSV without it
+    pacsv = None
 
 
 # Database configuration
@@ -31,7 +47,63 @@ DB_CONFIG = {
 # Directory containing CSV files
 CSV_DIRECTORY = 'synthetic_clinical_data'
 
+# Maximum number of CSV files loaded in parallel
+MAX_WORKERS = 8
+
+# Session settings for the bulk load (they only affect this connection,
+# other clients keep the server defaults)
+SESSION_SETTINGS = {
+    'synchronous_commit': 'off',
+    'maintenance_work_mem': '1GB',
+    'wal_compression': 'on',
+    # Skip trigger and foreign key firing for the loaded rows (superuser only)
+    'session_replication_role': 'replica',
+    # More memory for temp tables and sorts before spilling to disk
+    'temp_buffers': '256MB',
+    'work_mem': '256MB',
+}
+
+# Chunk sizes for streaming CSV files: rows for pandas, bytes for pyarrow
+CSV_CHUNK_ROWS = 200_000
+CSV_BLOCK_SIZE = 16 << 20
+
+# Binary COPY framing: signature, flags and header extension length / end marker
+BINARY_COPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + bytes(8)
+BINARY_COPY_TRAILER = b'\xff\xff'
+
+# Microseconds from the Unix epoch to PostgreSQL's 2000-01-01 epoch
+POSTGRES_EPOCH_US = 946_684_800_000_000
+
+# Minimum seconds between progress updates while inserting rows
+PROGRESS_INTERVAL = 0.5
+
+# Rows pandas reads up front to infer column types for the streaming read
+DTYPE_SAMPLE_ROWS = 10_000
+
+# Strings read as missing values (pandas' default na_values, used for pyarrow too)
+NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a',
+    'nan', 'null'
+]
 
+# Runs of spaces, special characters and underscores in column names
+COLUMN_SEPARATOR_RE = re.compile(r'[\W_]+')
+
+# PostgreSQL type per dtype kind (BIGINT rather than INTEGER to handle large
+# numbers); any other kind is stored as TEXT
+KIND_TO_PG_TYPE = {
+    'i': 'BIGINT',
+    'u': 'BIGINT',
+    'f': 'DOUBLE PRECISION',
+    'b': 'BOOLEAN',
+    'M': 'TIMESTAMP',
+    'm': 'INTERVAL',
+    'O': 'TEXT',
+}
+
+
+@lru_cache(maxsize=4096)
 def sanitize_column_name(column_name: str) -> str:
     """
     Sanitize column names to be PostgreSQL-friendly.
@@ -42,18 +114,9 @@ def sanitize_column_name(column_name: str) -> str:
     Returns:
         Sanitized column name
     """
-    # Convert to lowercase
-    name = column_name.lower()
-    
-    # Replace spaces and special characters with underscores
-    name = re.sub(r'[^\w\s]', '_', name)
-    name = re.sub(r'\s+', '_', name)
-    
-    # Remove consecutive underscores
-    name = re.sub(r'_+', '_', name)
-    
-    # Remove leading/trailing underscores
-    name = name.strip('_')
+    # Replace spaces and special characters with single underscores,
+    # removing leading/trailing ones
+    name = COLUMN_SEPARATOR_RE.sub('_', column_name.lower()).strip('_')
     
     # Ensure it doesn't start with a number
     if name and name[0].isdigit():
@@ -66,6 +129,89 @@ def sanitize_column_name(column_name: str) -> str:
     return name
 
 
+def sample_dtypes(csv_path: str) -> Dict[str, any]:
+    """
+    Infer column dtypes for a CSV file from its first rows.
+    
+    Integer and boolean columns get nullable dtypes, since missing values
+    may still appear past the sample.
+    
+    Args:
+        csv_path: Path to CSV file
+        
+    Returns:
+        Mapping of column name to dtype, usable as read_csv's dtype argument
+    """
+    sample = pd.read_csv(csv_path, nrows=DTYPE_SAMPLE_ROWS)
+    
+    dtypes = {}
+    for col, dtype in sample.dtypes.items():
+        if dtype.kind == 'i':
+            dtypes[col] = 'Int64'
+        elif dtype.kind == 'u':
+            dtypes[col] = 'UInt64'
+        elif dtype.kind == 'b':
+            dtypes[col] = 'boolean'
+        else:
+            dtypes[col] = dtype
+    return dtypes
+
+
+def read_csv_chunks(csv_path: str) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV file as a stream of DataFrame chunks.
+    
+    Uses pyarrow's multi-threaded streaming CSV reader when it is installed,
+    otherwise the pandas parser. Either way, column names and types come
+    from pandas reading the first DTYPE_SAMPLE_ROWS rows (see
+    sample_dtypes): pyarrow is given pandas' names for duplicate and empty
+    headers, and reads every column as the type pandas inferred, with text
+    for anything pandas left as text (such as dates, or integers too wide
+    for 64 bits). A later value that does not parse as its column's type
+    raises ValueError. At least one (possibly empty) chunk is always
+    yielded.
+    
+    Args:
+        csv_path: Path to CSV file
+        
+    Yields:
+        DataFrames holding consecutive rows of the file
+    """
+    dtypes = sample_dtypes(csv_path)
+    if pacsv is None:
+        yield from pd.read_csv(csv_path, dtype=dtypes, chunksize=CSV_CHUNK_ROWS)
+        return
+    
+    # Arrow type per pandas dtype kind; any other column is read as text
+    arrow_types = {'i': pa.int64(), 'u': pa.uint64(), 'f': pa.float64(), 'b': pa.bool_()}
+    column_types = {
+        name: arrow_types.get(pd.api.types.pandas_dtype(dtype).kind, pa.string())
+        for name, dtype in dtypes.items()
+    }
+    
+    # The header row is replaced by pandas' (deduplicated) column names
+    read_options = pacsv.ReadOptions(column_names=list(dtypes), skip_rows_after_names=1,
+                                     block_size=CSV_BLOCK_SIZE, use_threads=True)
+    parse_options = pacsv.ParseOptions(newlines_in_values=True)  # quoted fields may span lines
+    convert_options = pacsv.ConvertOptions(column_types=column_types, null_values=NA_VALUES,
+                                           strings_can_be_null=True)
+    reader = pacsv.open_csv(csv_path, read_options=read_options, parse_options=parse_options,
+                            convert_options=convert_options)
+    
+    # Same nullable dtypes as sample_dtypes picks for the pandas parser
+    types_mapper = {
+        pa.int64(): pd.Int64Dtype(), pa.uint64(): pd.UInt64Dtype(), pa.bool_(): pd.BooleanDtype()
+    }.get
+    
+    with reader:
+        empty = True
+        for batch in reader:
+            empty = False
+            yield batch.to_pandas(types_mapper=types_mapper)
+        if empty:
+            yield reader.schema.empty_table().to_pandas(types_mapper=types_mapper)
+
+
 def get_postgres_type(dtype) -> str:
     """
     Map pandas dtype to PostgreSQL type.
@@ -76,118 +222,516 @@ def get_postgres_type(dtype) -> str:
     Returns:
         PostgreSQL type as string
     """
-    dtype_str = str(dtype)
-    
-    if 'int' in dtype_str:
-        return 'BIGINT'  # Use BIGINT instead of INTEGER to handle large numbers
-    elif 'float' in dtype_str:
-        return 'DOUBLE PRECISION'
-    elif 'bool' in dtype_str:
-        return 'BOOLEAN'
-    elif 'datetime' in dtype_str:
-        return 'TIMESTAMP'
-    elif 'date' in dtype_str:
-        return 'DATE'
-    else:
-        return 'TEXT'
+    # Extension dtypes (Int64, boolean, string, ...) report a matching kind
+    return KIND_TO_PG_TYPE.get(dtype.kind, 'TEXT')
 
 
-def create_table(cursor, table_name: str, df: pd.DataFrame) -> None:
+def resolve_columns(columns: Iterable[str]) -> List[str]:
     """
-    Create a PostgreSQL table based on DataFrame structure.
+    Map CSV column names to the table column names used for them.
+    
+    Names are sanitized, and a column that would be called 'id' is renamed
+    to 'original_id' to avoid a conflict with the primary key.
     
     Args:
-        cursor: PostgreSQL cursor
-        table_name: Name of the table to create
-        df: DataFrame containing the data
+        columns: Original column names
+        
+    Returns:
+        Table column names, in the same order
     """
     # Sanitize column names
-    sanitized_columns = {col: sanitize_column_name(col) for col in df.columns}
-    
-    # Check if 'id' column already exists after sanitization
-    has_id_column = 'id' in [sanitized_col.lower() for sanitized_col in sanitized_columns.values()]
+    sanitized_columns = [sanitize_column_name(col) for col in columns]
     
     # If 'id' column exists, rename it to avoid conflict with primary key
-    if has_id_column:
-        new_sanitized_columns = {}
-        for col, sanitized_col in sanitized_columns.items():
-            if sanitized_col.lower() == 'id':
-                new_sanitized_columns[col] = 'original_id'
-            else:
-                new_sanitized_columns[col] = sanitized_col
-        sanitized_columns = new_sanitized_columns
+    return ['original_id' if col == 'id' else col for col in sanitized_columns]
+
+
+def column_list(columns: List[str]) -> sql.Composed:
+    """
+    Build a quoted, comma-separated SQL column list.
+    
+    Args:
+        columns: Column names
+        
+    Returns:
+        Composable column list for use in a query
+    """
+    return sql.SQL(', ').join(map(sql.Identifier, columns))
+
+
+def create_table(cursor, table_name: str, df: pd.DataFrame, columns: List[str]) -> None:
+    """
+    Create a PostgreSQL table based on DataFrame structure.
+    
+    The id column's primary key is added by finalize_table once the data
+    is loaded, so its index is built in one pass instead of row by row.
     
+    Args:
+        cursor: PostgreSQL cursor
+        table_name: Name of the table to create
+        df: DataFrame containing the data
+        columns: Table column names, in DataFrame column order
+    """
     # Build CREATE TABLE statement
     columns_def = []
-    for col, sanitized_col in sanitized_columns.items():
-        pg_type = get_postgres_type(df[col].dtype)
-        columns_def.append(f'"{sanitized_col}" {pg_type}')
+    for col, dtype in zip(columns, df.dtypes):
+        pg_type = get_postgres_type(dtype)
+        columns_def.append(sql.SQL('{} {}').format(sql.Identifier(col), sql.SQL(pg_type)))
     
-    columns_str = ',\n    '.join(columns_def)
+    columns_str = sql.SQL(',\n        ').join(columns_def)
     
     # Drop table if exists and create new one
-    drop_query = f'DROP TABLE IF EXISTS "{table_name}" CASCADE;'
-    create_query = f'''
-    CREATE TABLE "{table_name}" (
-        id SERIAL PRIMARY KEY,
-        {columns_str}
+    drop_query = sql.SQL('DROP TABLE IF EXISTS {} CASCADE;').format(sql.Identifier(table_name))
+    create_query = sql.SQL('''
+    CREATE UNLOGGED TABLE {} (
+        id SERIAL,
+        {}
     );
-    '''
+    ''').format(sql.Identifier(table_name), columns_str)
     
-    cursor.execute(drop_query)
-    cursor.execute(create_query)
+    # Both statements go to the server in one round trip
+    cursor.execute(drop_query + create_query)
     
     print(f"  ✓ Created table: {table_name}")
 
 
-def insert_data(cursor, table_name: str, df: pd.DataFrame) -> int:
+def finalize_table(cursor, table_name: str, keep_unlogged: bool = False) -> None:
     """
-    Insert data from DataFrame into PostgreSQL table.
+    Make a loaded table crash-safe, add its primary key and collect planner
+    statistics.
+    
+    Tables are created UNLOGGED so loading them writes no WAL; SET LOGGED
+    writes the finished table to WAL once by rewriting it. The primary key
+    is added after that, so its index is built once, not built and then
+    rebuilt by the rewrite.
     
     Args:
         cursor: PostgreSQL cursor
         table_name: Name of the table
+        keep_unlogged: Leave the table UNLOGGED (its data is lost on a crash)
+    """
+    statements = []
+    if not keep_unlogged:
+        statements.append(sql.SQL('ALTER TABLE {} SET LOGGED;').format(sql.Identifier(table_name)))
+    statements.append(sql.SQL('ALTER TABLE {} ADD PRIMARY KEY (id);').format(sql.Identifier(table_name)))
+    statements.append(sql.SQL('ANALYZE {};').format(sql.Identifier(table_name)))
+    
+    # All statements go to the server in one round trip
+    cursor.execute(sql.SQL(' ').join(statements))
+
+
+def copy_server_file(cursor, table_name: str, csv_path: str, columns: List[str]) -> Optional[int]:
+    """
+    Load a CSV file with server-side COPY ... FROM '<path>'.
+    
+    The server reads the file itself, so no data passes through this client.
+    This needs superuser or pg_read_server_files, and the file must be
+    readable by the server process. Values are loaded as written in the
+    file: only empty fields become NULL.
+    
+    Args:
+        cursor: PostgreSQL cursor
+        table_name: Name of the table
+        csv_path: Path to CSV file
+        columns: Table column names, in file column order
+        
+    Returns:
+        Number of rows copied, or None if the server could not load the file
+    """
+    copy_query = sql.SQL("COPY {} ({}) FROM {} WITH (FORMAT CSV, HEADER, NULL '')").format(
+        sql.Identifier(table_name),
+        column_list(columns),
+        sql.Literal(os.path.abspath(csv_path))
+    )
+    
+    cursor.execute("SAVEPOINT server_copy")
+    try:
+        cursor.execute(copy_query)
+    except (psycopg2.errors.InsufficientPrivilege, psycopg2.errors.UndefinedFile, psycopg2.DataError) as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT server_copy")
+        print(f"  ⚠ Server-side COPY failed, sending data from client: {e}")
+        return None
+    
+    rows_copied = cursor.rowcount
+    cursor.execute("RELEASE SAVEPOINT server_copy")
+    
+    print(f"  ✓ Inserted {rows_copied} rows into {table_name} (server-side COPY)")
+    return rows_copied
+
+
+def copy_raw_file(cursor, table_name: str, csv_path: str, columns: List[str]) -> Optional[int]:
+    """
+    Stream a CSV file unparsed to COPY ... FROM STDIN.
+    
+    The file's bytes are sent as-is instead of being parsed with pandas and
+    written back out, which also works for remote servers. As with
+    server-side COPY, values are loaded as written in the file: only empty
+    fields become NULL.
+    
+    Args:
+        cursor: PostgreSQL cursor
+        table_name: Name of the table
+        csv_path: Path to CSV file
+        columns: Table column names, in file column order
+        
+    Returns:
+        Number of rows copied, or None if the file did not fit the table
+    """
+    copy_query = sql.SQL(
+        "COPY {} ({}) FROM STDIN WITH (FORMAT CSV, HEADER, NULL '', ENCODING 'UTF8')"
+    ).format(sql.Identifier(table_name), column_list(columns))
+    
+    cursor.execute("SAVEPOINT raw_copy")
+    try:
+        with open(csv_path, 'rb') as f:
+            cursor.copy_expert(copy_query, f, size=CSV_BLOCK_SIZE)
+    except psycopg2.DataError as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT raw_copy")
+        print(f"  ⚠ Raw COPY failed, parsing the file instead: {e}")
+        return None
+    
+    rows_copied = cursor.rowcount
+    cursor.execute("RELEASE SAVEPOINT raw_copy")
+    
+    print(f"  ✓ Inserted {rows_copied} rows into {table_name} (raw COPY)")
+    return rows_copied
+
+
+def print_progress(rows: int, last_printed: float) -> float:
+    """
+    Show the inserted-row count, at most once every PROGRESS_INTERVAL seconds.
+    
+    Args:
+        rows: Rows inserted so far
+        last_printed: time.monotonic() of the previous update
+        
+    Returns:
+        time.monotonic() of the latest update
+    """
+    now = time.monotonic()
+    if now - last_printed < PROGRESS_INTERVAL:
+        return last_printed
+    
+    sys.stdout.write(f"  → Inserted {rows} rows\r")
+    sys.stdout.flush()
+    return now
+
+
+def iter_rows(df: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Iterate over DataFrame rows as tuples, with None for missing values.
+    
+    Rows are zipped straight from the columns, like itertuples, so no
+    intermediate 2D array is built. Columns that contain missing values are
+    converted to object dtype to swap NaN/NaT/NA for None, and so are
+    extension dtype columns (Int64, boolean, ...), whose values would
+    otherwise come out as NumPy scalars that psycopg2 cannot adapt.
+    
+    Args:
         df: DataFrame containing the data
         
     Returns:
-        Number of rows inserted
+        Iterator of row tuples in DataFrame column order
     """
-    if df.empty:
-        print(f"  ⚠ No data to insert for {table_name}")
+    columns = []
+    for _, series in df.items():
+        if series.hasnans or not isinstance(series.dtype, np.dtype):
+            series = series.astype(object).where(series.notna(), None)
+        columns.append(series)
+    return zip(*columns)
+
+
+def encode_binary_column(series: pd.Series, pg_type: str,
+                         encoding: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Encode one column's values as binary COPY fields.
+    
+    Args:
+        series: Column values
+        pg_type: PostgreSQL type of the table column
+        encoding: Python codec for text values
+        
+    Returns:
+        Tuple of (field length per row, -1 for NULL; concatenated bytes of
+        the non-NULL values), or None if the column cannot be encoded
+    """
+    nulls = series.isna().to_numpy()
+    kind = series.dtype.kind
+    
+    if pg_type == 'BIGINT' and kind in 'iu':
+        if kind == 'u' and not nulls.all() and series.max() > np.iinfo(np.int64).max:
+            return None
+        values = series.to_numpy(dtype=np.int64, na_value=0)[~nulls].astype('>i8')
+    elif pg_type == 'DOUBLE PRECISION' and kind in 'iuf':
+        values = series.to_numpy(dtype=np.float64, na_value=0.0)[~nulls].astype('>f8')
+    elif pg_type == 'BOOLEAN' and kind == 'b':
+        values = series.to_numpy(dtype=bool, na_value=False)[~nulls].astype(np.uint8)
+    elif pg_type == 'TIMESTAMP' and kind == 'M' and isinstance(series.dtype, np.dtype):
+        micros = series.to_numpy()[~nulls].astype('datetime64[us]').view(np.int64)
+        values = (micros - POSTGRES_EPOCH_US).astype('>i8')
+    elif pg_type == 'TEXT':
+        encoded = [str(value).encode(encoding) for value in series.to_numpy(dtype=object)[~nulls]]
+        lengths = np.full(len(series), -1, dtype=np.int64)
+        lengths[~nulls] = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        return lengths, np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    else:
+        return None
+    
+    lengths = np.where(nulls, -1, values.dtype.itemsize)
+    return lengths, values.view(np.uint8)
+
+
+def encode_copy_binary(df: pd.DataFrame, pg_types: List[str], encoding: str) -> Optional[bytes]:
+    """
+    Encode DataFrame rows in PostgreSQL's binary COPY format with NumPy.
+    
+    Each column is converted in one vectorized step (big-endian numbers,
+    microsecond timestamps, encoded text), then scattered into its slot of
+    every row in a single output buffer, instead of packing values row by
+    row in Python.
+    
+    Args:
+        df: DataFrame containing the data
+        pg_types: PostgreSQL type of each table column, in DataFrame order
+        encoding: Python codec for text columns (the connection encoding)
+        
+    Returns:
+        The binary COPY data, or None if a column cannot be encoded this way
+    """
+    fields = []
+    for (_, series), pg_type in zip(df.items(), pg_types):
+        field = encode_binary_column(series, pg_type, encoding)
+        if field is None:
+            return None
+        fields.append(field)
+    
+    if not fields:
+        return None
+    
+    # Every row is a 2-byte field count, then a 4-byte length and the value
+    # bytes (none for NULL) per field
+    value_sizes = [np.maximum(lengths, 0) for lengths, _ in fields]
+    row_sizes = 2 + 4 * len(fields) + sum(value_sizes)
+    row_starts = np.cumsum(row_sizes) - row_sizes
+    buf = np.empty(int(row_sizes.sum()), dtype=np.uint8)
+    
+    def put(starts, sizes, data):
+        # Copy consecutive runs of data (sizes[i] bytes each) to buf[starts[i]:]
+        offsets = np.cumsum(sizes) - sizes
+        buf[np.repeat(starts - offsets, sizes) + np.arange(len(data))] = data
+    
+    row_count = len(df)
+    field_count = np.array([len(fields)], dtype='>i2').view(np.uint8)
+    put(row_starts, np.full(row_count, 2), np.tile(field_count, row_count))
+    
+    position = row_starts + 2
+    for (lengths, data), sizes in zip(fields, value_sizes):
+        put(position, np.full(row_count, 4), lengths.astype('>i4').view(np.uint8))
+        position += 4
+        
+        present = lengths >= 0
+        put(position[present], sizes[present], data)
+        position += sizes
+    
+    return BINARY_COPY_HEADER + buf.tobytes() + BINARY_COPY_TRAILER
+
+
+def copy_csv(cursor, table_name: str, chunks: Iterable[pd.DataFrame], columns: List[str],
+             progress: int = 0) -> int:
+    """
+    Stream DataFrame chunks into a table with a single CSV COPY FROM STDIN.
+    
+    The COPY runs on a background thread reading from a pipe, while this
+    thread serializes chunks into it, so parsing the file overlaps with the
+    server ingesting it and only one chunk is held in memory at a time.
+    
+    Args:
+        cursor: PostgreSQL cursor
+        table_name: Name of the table
+        chunks: DataFrames containing the data
+        columns: Target column names, in DataFrame column order
+        progress: Rows already inserted, for the progress indicator
+        
+    Returns:
+        Number of rows copied
+    """
+    # Prepare COPY statement
+    copy_query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT CSV, NULL '')").format(
+        sql.Identifier(table_name), column_list(columns)
+    )
+    
+    read_fd, write_fd = os.pipe()
+    reader = os.fdopen(read_fd, 'rb')
+    writer = os.fdopen(write_fd, 'w', encoding=encodings[cursor.connection.encoding], newline='')
+    errors = []
+    
+    def run_copy():
+        try:
+            cursor.copy_expert(copy_query, reader)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # Unblocks the writer if COPY stopped early
+            reader.close()
+    
+    copy_thread = threading.Thread(target=run_copy, daemon=True)
+    copy_thread.start()
+    
+    copied = 0
+    last_printed = 0.0
+    try:
+        for chunk in chunks:
+            chunk.to_csv(writer, index=False, header=False, na_rep='')
+            copied += len(chunk)
+            
+            # Progress indicator
+            last_printed = print_progress(progress + copied, last_printed)
+    except BrokenPipeError:
+        pass  # COPY failed; its error is raised below
+    finally:
+        try:
+            writer.close()
+        except BrokenPipeError:
+            pass
+        copy_thread.join()
+    
+    if errors:
+        raise errors[0]
+    return copied
+
+
+def copy_binary(cursor, table_name: str, chunks: Iterable[pd.DataFrame], columns: List[str]) -> int:
+    """
+    Copy DataFrame chunks into a table with binary COPY, one COPY per chunk.
+    
+    Values are sent in PostgreSQL's binary format, so numbers and timestamps
+    are not converted to text and parsed again on the server. From the first
+    chunk encode_copy_binary cannot handle, that chunk and the rest are sent
+    with CSV COPY instead.
+    
+    Args:
+        cursor: PostgreSQL cursor
+        table_name: Name of the table
+        chunks: DataFrames containing the data, all with the same columns
+        columns: Table column names, in DataFrame column order
+        
+    Returns:
+        Number of rows copied
+    """
+    chunks = iter(chunks)
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
         return 0
     
-    # Sanitize column names
-    sanitized_columns = [sanitize_column_name(col) for col in df.columns]
+    # Column types as created by create_table from the first chunk
+    pg_types = [get_postgres_type(dtype) for dtype in first_chunk.dtypes]
+    encoding = encodings[cursor.connection.encoding]
+    binary_query = sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)").format(
+        sql.Identifier(table_name), column_list(columns)
+    )
     
-    # Check if 'id' column exists and rename it to avoid conflict
-    has_id_column = 'id' in [col.lower() for col in sanitized_columns]
-    if has_id_column:
-        sanitized_columns = ['original_id' if col.lower() == 'id' else col for col in sanitized_columns]
+    copied = 0
+    last_printed = 0.0
+    for chunk in chain([first_chunk], chunks):
+        data = encode_copy_binary(chunk, pg_types, encoding)
+        if data is None:
+            print(f"  ⚠ Binary COPY not possible for {table_name}, using CSV COPY")
+            return copied + copy_csv(cursor, table_name, chain([chunk], chunks), columns, copied)
+        
+        cursor.copy_expert(binary_query, BytesIO(data))
+        copied += len(chunk)
+        
+        # Progress indicator
+        last_printed = print_progress(copied, last_printed)
     
-    # Rename DataFrame columns to match sanitized names
-    df_copy = df.copy()
-    df_copy.columns = sanitized_columns
+    return copied
+
+
+def copy_supported(cursor) -> bool:
+    """
+    Check whether the server accepts COPY FROM STDIN.
     
-    # Replace NaN with None for proper NULL insertion
-    df_copy = df_copy.where(pd.notnull(df_copy), None)
+    Some PostgreSQL-compatible servers and proxies reject COPY; this sends
+    an empty COPY into a temporary table to find out. The transaction is
+    rolled back afterwards, which also drops the table.
     
-    # Prepare insert query
-    columns_str = ', '.join([f'"{col}"' for col in sanitized_columns])
-    placeholders = ', '.join(['%s'] * len(sanitized_columns))
-    insert_query = f'INSERT INTO "{table_name}" ({columns_str}) VALUES ({placeholders})'
+    Args:
+        cursor: PostgreSQL cursor
+        
+    Returns:
+        True if COPY can be used
+    """
+    try:
+        cursor.execute("CREATE TEMPORARY TABLE copy_check (value INTEGER)")
+        cursor.copy_expert("COPY copy_check FROM STDIN WITH (FORMAT CSV)", StringIO())
+    except psycopg2.errors.FeatureNotSupported:
+        return False
+    finally:
+        cursor.connection.rollback()
     
-    # Insert data in batches
-    batch_size = 1000
-    total_rows = len(df_copy)
+    return True
+
+
+def insert_values(cursor, table_name: str, chunks: Iterable[pd.DataFrame], columns: List[str]) -> int:
+    """
+    Insert DataFrame chunks with multi-row INSERT statements.
+    
+    Used when COPY is not available. execute_values sends one INSERT with
+    1000 rows of VALUES per round trip.
     
-    for i in range(0, total_rows, batch_size):
-        batch = df_copy.iloc[i:i+batch_size]
-        data = [tuple(row) for row in batch.values]
-        cursor.executemany(insert_query, data)
+    Args:
+        cursor: PostgreSQL cursor
+        table_name: Name of the table
+        chunks: DataFrames containing the data
+        columns: Target column names, in DataFrame column order
+        
+    Returns:
+        Number of rows inserted
+    """
+    # Prepare insert query
+    insert_query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        sql.Identifier(table_name), column_list(columns)
+    )
+    
+    total_rows = 0
+    last_printed = 0.0
+    for chunk in chunks:
+        execute_values(cursor, insert_query, iter_rows(chunk), page_size=1000)
+        total_rows += len(chunk)
         
         # Progress indicator
-        progress = min(i + batch_size, total_rows)
-        print(f"  → Inserted {progress}/{total_rows} rows", end='\r')
+        last_printed = print_progress(total_rows, last_printed)
+    
+    return total_rows
+
+
+def insert_data(cursor, table_name: str, chunks: Iterable[pd.DataFrame], columns: List[str],
+                use_copy: bool = True) -> int:
+    """
+    Insert data from DataFrame chunks into PostgreSQL table.
+    
+    Rows are loaded with binary COPY, encoded column-wise with NumPy.
+    Anything that encoder cannot handle falls back to CSV COPY, and servers
+    that do not support COPY get multi-row INSERTs.
+    
+    Args:
+        cursor: PostgreSQL cursor
+        table_name: Name of the table
+        chunks: DataFrames containing the data, all with the same columns
+        columns: Table column names, in DataFrame column order
+        use_copy: Whether the server supports COPY (see copy_supported)
+        
+    Returns:
+        Number of rows inserted
+    """
+    if use_copy:
+        total_rows = copy_binary(cursor, table_name, chunks, columns)
+    else:
+        total_rows = insert_values(cursor, table_name, chunks, columns)
+    
+    if total_rows == 0:
+        print(f"  ⚠ No data to insert for {table_name}")
+        return 0
     
     print(f"  ✓ Inserted {total_rows} rows into {table_name}           ")
     return total_rows
@@ -208,14 +752,83 @@ def get_table_name_from_filename(filename: str) -> str:
     return table_name
 
 
-def load_csv_to_postgres(csv_path: str, cursor, conn) -> Dict[str, any]:
+def apply_session_settings(cursor, conn, settings: Dict[str, str] = SESSION_SETTINGS) -> Dict[str, str]:
     """
-    Load a single CSV file into PostgreSQL.
+    Apply session settings to the connection.
+    
+    All settings are sent in a single round trip. If the server rejects any
+    of them (for example superuser-only ones), they are applied one by one
+    and the rejected ones are skipped with a warning.
     
     Args:
-        csv_path: Path to CSV file
         cursor: PostgreSQL cursor
         conn: PostgreSQL connection
+        settings: Mapping of setting name to value
+        
+    Returns:
+        The settings that were applied
+    """
+    rejected_errors = (psycopg2.errors.InsufficientPrivilege, psycopg2.errors.UndefinedObject,
+                       psycopg2.errors.CantChangeRuntimeParam, psycopg2.errors.InvalidParameterValue)
+    statements = {
+        name: sql.SQL("SET {} = {};").format(sql.Identifier(name), sql.Literal(value))
+        for name, value in settings.items()
+    }
+    
+    try:
+        cursor.execute(sql.SQL(' ').join(statements.values()))
+        
+        # Session-level SETs are undone if their transaction rolls back
+        conn.commit()
+        return dict(settings)
+    except rejected_errors:
+        conn.rollback()
+    
+    applied = {}
+    for name, statement in statements.items():
+        cursor.execute("SAVEPOINT session_setting")
+        try:
+            cursor.execute(statement)
+        except rejected_errors as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT session_setting")
+            print(f"  ⚠ Could not set {name}: {e}")
+        else:
+            cursor.execute("RELEASE SAVEPOINT session_setting")
+            applied[name] = settings[name]
+    
+    conn.commit()
+    return applied
+
+
+def is_local_host(host: str) -> bool:
+    """
+    Check whether a PostgreSQL host refers to this machine.
+    
+    Args:
+        host: Host name, IP address or Unix socket directory
+        
+    Returns:
+        True for loopback addresses and Unix sockets
+    """
+    return host in ('localhost', '127.0.0.1', '::1') or host.startswith('/')
+
+
+def load_csv_to_postgres(csv_path: str, server_side: bool = False, raw_copy: bool = False,
+                         use_copy: bool = True, keep_unlogged: bool = False,
+                         settings: Dict[str, str] = SESSION_SETTINGS) -> Dict[str, any]:
+    """
+    Load a single CSV file into PostgreSQL.
+    
+    Each call opens its own connection, so files can be loaded in parallel
+    worker processes.
+    
+    Args:
+        csv_path: Path to CSV file
+        server_side: Try having the server read the file itself first
+        raw_copy: Try streaming the file unparsed when its header needs no renaming
+        use_copy: Whether the server supports COPY; rows are INSERTed otherwise
+        keep_unlogged: Leave the table UNLOGGED after loading
+        settings: Session settings to apply to the connection
         
     Returns:
         Dictionary with load statistics
@@ -226,30 +839,75 @@ def load_csv_to_postgres(csv_path: str, cursor, conn) -> Dict[str, any]:
     print(f"\n📄 Processing: {filename}")
     print(f"  → Loading CSV file...")
     
+    conn = None
     try:
-        # Read CSV file
-        df = pd.read_csv(csv_path, low_memory=False)
-        print(f"  ✓ Loaded {len(df)} rows, {len(df.columns)} columns")
-        
-        # Create table
-        create_table(cursor, table_name, df)
+        conn = psycopg2.connect(**DB_CONFIG)
+        cursor = conn.cursor()
+        apply_session_settings(cursor, conn, settings)
         
-        # Insert data
-        rows_inserted = insert_data(cursor, table_name, df)
+        try:
+            # Stream CSV file; the first chunk determines the column types
+            chunks = read_csv_chunks(csv_path)
+            df = next(chunks)
+            columns = resolve_columns(df.columns)
+            print(f"  ✓ Reading {len(df.columns)} columns")
+            
+            # Create table
+            create_table(cursor, table_name, df, columns)
+            
+            # Insert data
+            rows_inserted = None
+            if server_side:
+                rows_inserted = copy_server_file(cursor, table_name, csv_path, columns)
+            if rows_inserted is None and raw_copy:
+                if list(df.columns) == columns:
+                    rows_inserted = copy_raw_file(cursor, table_name, csv_path, columns)
+                else:
+                    print(f"  → Column names need sanitizing, parsing the file instead of raw COPY")
+            if rows_inserted is None:
+                rows_inserted = insert_data(cursor, table_name, chain([df], chunks), columns, use_copy)
+            chunks.close()
+            
+        except (ValueError, psycopg2.DataError) as e:
+            # The streaming reader could not parse the file (for example rows
+            # with missing fields), or a later chunk did not fit the column
+            # types of the first one
+            conn.rollback()
+            print(f"  ⚠ Could not stream {filename} ({e}), reloading in one pass...")
+            
+            df = pd.read_csv(csv_path, low_memory=False)
+            columns = resolve_columns(df.columns)
+            create_table(cursor, table_name, df, columns)
+            
+            # Still sent in CSV_CHUNK_ROWS slices to bound the encoding buffers
+            slices = (df.iloc[i:i + CSV_CHUNK_ROWS] for i in range(0, len(df), CSV_CHUNK_ROWS))
+            rows_inserted = insert_data(cursor, table_name, slices, columns, use_copy)
         
         # Commit transaction
         conn.commit()
         
+        # Make the table durable, then build the primary key index and analyze it
+        finalize_error = None
+        try:
+            finalize_table(cursor, table_name, keep_unlogged)
+            conn.commit()
+        except psycopg2.Error as e:
+            conn.rollback()
+            finalize_error = str(e).strip()
+            print(f"  ⚠ Could not finalize {table_name}: {e}")
+        
         return {
             'filename': filename,
             'table_name': table_name,
             'status': 'success',
             'rows': rows_inserted,
-            'columns': len(df.columns)
+            'columns': len(df.columns),
+            'finalize_error': finalize_error
         }
         
     except Exception as e:
-        conn.rollback()
+        if conn is not None:
+            conn.rollback()
         print(f"  ✗ Error processing {filename}: {str(e)}")
         return {
             'filename': filename,
@@ -257,18 +915,46 @@ def load_csv_to_postgres(csv_path: str, cursor, conn) -> Dict[str, any]:
             'status': 'failed',
             'error': str(e)
         }
+    
+    finally:
+        if conn is not None:
+            conn.close()
 
 
 def main():
     """Main function to orchestrate CSV upload to PostgreSQL."""
     
+    parser = argparse.ArgumentParser(description='Upload CSV files to PostgreSQL.')
+    parser.add_argument(
+        '--server-side', action='store_true',
+        help="let a local PostgreSQL server read the CSV files directly "
+             "(needs pg_read_server_files; only empty fields become NULL)"
+    )
+    parser.add_argument(
+        '--raw-copy', action='store_true',
+        help="stream CSV files whose header needs no renaming to COPY without "
+             "parsing them (only empty fields become NULL)"
+    )
+    parser.add_argument(
+        '--workers', type=int, default=MAX_WORKERS,
+        help=f"number of files to load in parallel (default: {MAX_WORKERS})"
+    )
+    parser.add_argument(
+        '--keep-unlogged', action='store_true',
+        help="leave tables UNLOGGED after loading (faster, but their data "
+             "is lost if the server crashes)"
+    )
+    args = parser.parse_args()
+    
     print("=" * 70)
     print("CSV to PostgreSQL Upload Script")
     print("=" * 70)
     
     # Get password
     password = getpass.getpass(f"Enter password for PostgreSQL user '{DB_CONFIG['user']}': ")
-    DB_CONFIG['password'] = password
+    
+    # Passed through the environment so worker processes can connect too
+    os.environ['PGPASSWORD'] = password
     
     # Check if CSV directory exists
     csv_dir = Path(CSV_DIRECTORY)
@@ -297,19 +983,42 @@ def main():
         cursor = conn.cursor()
         print(f"  ✓ Connected successfully!")
         
+        # Find the settings the server accepts and whether it supports COPY
+        # once, rather than per file
+        settings = apply_session_settings(cursor, conn)
+        use_copy = copy_supported(cursor)
+        cursor.close()
+        conn.close()
+        
     except psycopg2.Error as e:
         print(f"\n✗ Error connecting to PostgreSQL: {e}")
         sys.exit(1)
     
-    # Process each CSV file
-    results = []
-    for csv_file in csv_files:
-        result = load_csv_to_postgres(str(csv_file), cursor, conn)
-        results.append(result)
+    # Server-side COPY only works when the server can see our files
+    server_side = args.server_side and is_local_host(DB_CONFIG['host'])
+    if args.server_side and not server_side:
+        print(f"\n⚠ --server-side ignored: {DB_CONFIG['host']} is not a local host")
     
-    # Close connection
-    cursor.close()
-    conn.close()
+    if not use_copy:
+        print(f"\n⚠ COPY not supported by the server, inserting with INSERT ... VALUES")
+    
+    # Process CSV files, each over its own connection
+    load_file = partial(
+        load_csv_to_postgres,
+        server_side=server_side and use_copy,
+        raw_copy=args.raw_copy and use_copy,
+        use_copy=use_copy,
+        keep_unlogged=args.keep_unlogged,
+        settings=settings
+    )
+    workers = max(1, min(args.workers, len(csv_files)))
+    
+    if workers == 1:
+        results = [load_file(str(csv_file)) for csv_file in csv_files]
+    else:
+        print(f"\n⚙ Loading with {workers} parallel workers")
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(load_file, [str(csv_file) for csv_file in csv_files])
     
     # Print summary
     print("\n" + "=" * 70)
@@ -329,6 +1038,13 @@ def main():
         for r in successful:
             print(f"  • {r['table_name']}: {r['rows']:,} rows, {r['columns']} columns")
     
+    unfinalized = [r for r in successful if r['finalize_error']]
+    if unfinalized:
+        print("\n⚠ Loaded but not finalized (may lack a primary key and still be UNLOGGED, "
+              "losing its data on a crash):")
+        for r in unfinalized:
+            print(f"  • {r['table_name']}: {r['finalize_error']}")
+    
     if failed:
         print("\n⚠ Failed uploads:")
         for r in failed: